@@ -3,9 +3,17 @@
 # rates to evaluate two scenarios: rate limiting and adaptive scaling.
 
 # Import Libraries
+import argparse # selects the simulation backend from the command line.
+import os # used to size the worker pool to the available cores.
 import simpy # provides a framework for simulating real-life events and processes.
-import random # helps ingenerating random delays.
-import matplotlib.pyplot as plt # used for visualizing the results through bar charts.
+from collections import deque # FIFO of waiting requests for the slim resource.
+from multiprocessing import Pool # runs the independent simulations in parallel.
+import json # serializes the sweep results when plotting is disabled.
+import numpy as np # used for batch-generating the random delays.
+# matplotlib is imported lazily inside the plotting branch so the sweep itself can
+# run on interpreters where it is unavailable or slow to import (e.g. PyPy, whose
+# tracing JIT speeds up the pure-Python SimPy event loop considerably); use
+# '--no-plot' there and feed the JSON output to a separate plotting script.
 
 # Parameters
 # These are initial configuration settings:
@@ -14,6 +22,7 @@ SIM_TIME = 50 # Total simulation time.
 RATE_LIMIT = 1       # Maximum requests per second for rate-limiing mode.
 QUEUE_THRESHOLD = 3  # Queue length threshold to trigger adaptive scaling.
 SCALING_DURATION = 5 # Duration for which the server capacity is scaled up in adaptive scaling.
+DEBUG = False # Set to True to print a trace of every event (slow; benchmark runs keep it off).
 
 # Different rate combinations for testing
 # Each tuple represents different rates for user and attack requests, allowing us to test how
@@ -25,26 +34,91 @@ rate_combinations = [
     (60, 20)    # Scenario 4
 ]
 
+# One bar color per scenario, shared by every subplot and figure.
+PALETTE = ['#4C72B0', '#55A868', '#C44E52', '#8172B2']
+
+# Subplot title, y-axis label, and bar-label format for each reported metric.
+METRICS = [
+    ("Average Response Time for Each Scenario", "Time (s)", "%.2f"),
+    ("Processed Legitimate Requests for Each Scenario", "Processed Requests", "%d"),
+    ("Dropped Legitimate Requests for Each Scenario", "Dropped Requests", "%d"),
+]
+
+# Plotting Helper
+# Draws one strategy's three metric subplots onto an existing row of axes. The
+# caller owns the figure, so a single figure can be cleared and reused for every
+# strategy instead of being rebuilt from scratch each time.
+def plot_strategy(ax, scenarios, data):
+    for k, (title, ylabel, fmt) in enumerate(METRICS):
+        bars = ax[k].bar(scenarios, data[:, k], color=PALETTE)
+        ax[k].set_title(title)
+        ax[k].set_ylabel(ylabel)
+        ax[k].tick_params(axis='x')
+        ax[k].bar_label(bars, fmt=fmt) # Each bar includes the correspondind value
+
+# Exponential Inter-Arrival Times
+# Drawing the delays one at a time with 'random.expovariate' pays the Python call
+# overhead on every event. Instead this generator asks numpy for a whole batch of
+# exponential samples at once and hands them out one by one, refilling lazily.
+# Each simulation passes its own seeded Generator so runs are reproducible even
+# when dispatched across pool workers (and PCG64's vectorized fill is faster than
+# the legacy global Mersenne-Twister state).
+def rand_exp_gen(rate, size=1024, rng=None):
+    if rng is None:
+        rng = np.random.default_rng()
+    while True:
+        for x in rng.exponential(1.0 / rate, size=size):
+            yield x
+
+# Slim Server Resource
+# simpy.Resource carries FIFO queueing, preemption hooks, and monitoring, but the
+# model only ever touches 'count', 'capacity', and the pending queue. This class
+# keeps exactly that: request() returns an already-succeeded event when a unit is
+# free (skipping SimPy's _trigger_put/_trigger_get chain entirely) or parks the
+# event in a deque, and release() hands the freed unit to the next waiter.
+class MiniResource:
+    def __init__(self, env, capacity=1):
+        self.env = env
+        self.capacity = capacity
+        self.count = 0 # requests currently holding a unit
+        self.queue = deque() # pending request events, in arrival order
+
+    def request(self):
+        evt = self.env.event()
+        if self.count < self.capacity:
+            self.count += 1
+            evt.succeed()
+        else:
+            self.queue.append(evt)
+        return evt
+
+    def release(self, req=None):
+        if req is not None and not req.triggered:
+            # The request was abandoned while still waiting (e.g. the owning
+            # process was torn down at the end of the run); it never held a unit.
+            self.queue.remove(req)
+            return
+        self.count -= 1
+        if self.queue and self.count < self.capacity:
+            self.count += 1
+            self.queue.popleft().succeed()
+
 # Server Class
 # This class models the server behavior:
 class Server:
-    def __init__(self, env, scaling=False):
+    def __init__(self, env, service_gen, scaling=False):
         self.env = env # The simulation environment
-        self.server = simpy.Resource(env, capacity=SERVER_INITIAL_CAPACITY) # Represents server resources
+        self.server = MiniResource(env, capacity=SERVER_INITIAL_CAPACITY) # Represents server resources
                                                                     # with specified capacity.
+        self.service_gen = service_gen # Pre-batched exponential service-time samples.
         self.scaling = scaling # Boolean indicationg if adaptive scaling is enabled.
         self.server_capacity = SERVER_INITIAL_CAPACITY # Stores initial capacity to reset after scaling.
         self.legitimate_processed_requests = 0 # Tracking metric for legitimate processed requests.
         self.legitimate_dropped_requests = 0  # Tracking metric for legitimate dropped requests.
-        self.response_times = [] # Collects response times for analysis.
-
-# Process Requests
-# This method processes requests by adding a simulated delay and record the response time.
-    def process_request(self, request_type, start_time):
-        yield self.env.timeout(random.expovariate(1.0))
-        response_time = self.env.now - start_time
-        self.response_times.append(response_time)
-        print(f"{self.env.now:.2f}s: {request_type} request processed")
+        self._rt_sum = 0.0 # Running sum of response times; only the average is ever
+        self._rt_count = 0 # reported, so two scalars replace an ever-growing list.
+        self._qlen = 0 # Requests waiting for the server, maintained incrementally so
+                       # the scaling check avoids the server.queue attribute chain.
 
 # Rate-Limited Requests
 # This function implements rate-limiting by checking if the server's usage is
@@ -53,127 +127,356 @@ class Server:
         # Apply rate limiting only to legitimate requests
         if request_type == "Legitimate" and self.server.count >= RATE_LIMIT:
             self.legitimate_dropped_requests += 1
-            print(f"{self.env.now:.2f}s: {request_type} request dropped due to rate limit")
+            if DEBUG:
+                print(f"{self.env.now:.2f}s: {request_type} request dropped due to rate limit")
         else:
-            start_time = self.env.now
-            with self.server.request() as req:
-                yield req
-                yield self.env.process(self.process_request(request_type, start_time))
-                if request_type == "Legitimate":
-                    self.legitimate_processed_requests += 1
+            yield from _serve(self.env, self, request_type)
+
+# Serve One Request
+# The acquire/serve/release sequence used to be duplicated in three places, each
+# wrapped in a 'with server.request()' context manager whose __enter__/__exit__
+# machinery runs on every request. This helper does the same work once with an
+# explicit try/finally release, and callers inline it via 'yield from'. The
+# service delay and response-time bookkeeping (formerly a separate
+# Server.process_request process) happen inline, so serving a request schedules
+# only the grant and the timeout rather than an extra Process per request.
+def _serve(env, server, request_type):
+    start_time = env.now
+    req = server.server.request()
+    server._qlen += 1
+    try:
+        yield req
+        server._qlen -= 1
+        yield env.timeout(next(server.service_gen))
+        server._rt_sum += env.now - start_time
+        server._rt_count += 1
+        if DEBUG:
+            print(f"{env.now:.2f}s: {request_type} request processed")
+        if request_type == "Legitimate":
+            server.legitimate_processed_requests += 1
+    finally:
+        server.server.release(req)
 
 # Scale Resources
-# If adaptive scaling is enabled, this function temporarily increases the server
-# capacity when the queue length exceeds 'QUEUE_THROSHOLD'.
-    def scale_resources(self):
-        if self.scaling and len(self.server.queue) >= QUEUE_THRESHOLD:
-            print(f"{self.env.now:.2f}s: Scaling up resources")
-            self.server.capacity += 1
-            yield self.env.timeout(SCALING_DURATION)
-            self.server.capacity = self.server_capacity
-            print(f"{self.env.now:.2f}s: Scaling down resources")
+# If adaptive scaling is enabled, one long-running monitor process wakes up at a
+# fixed interval and temporarily increases the server capacity when the queue
+# length exceeds 'QUEUE_THROSHOLD'. A single monitor replaces the old scheme of
+# spawning a fresh scale_resources process on every arrival, which allocated a
+# generator per event only to find the threshold unmet most of the time.
+def scaling_monitor(env, server, interval=0.5):
+    while True:
+        yield env.timeout(interval)
+        if server._qlen >= QUEUE_THRESHOLD and server.server.capacity == server.server_capacity:
+            if DEBUG:
+                print(f"{env.now:.2f}s: Scaling up resources")
+            server.server.capacity += 1
+            env.process(_scale_down_after(env, server, SCALING_DURATION))
+
+def _scale_down_after(env, server, delay):
+    yield env.timeout(delay)
+    server.server.capacity = server.server_capacity
+    if DEBUG:
+        print(f"{env.now:.2f}s: Scaling down resources")
 
 # Legitimate Request
 # This function simulates legitimate requests, handling rate limiting and adaptive scaling.
-def legitimate_user(env, server, scenario, user_rate):
+def legitimate_user(env, server, scenario, user_gen):
+    # Bind the methods touched on every iteration to locals once, turning the
+    # repeated attribute-chain lookups in the loop body into LOAD_FASTs. The
+    # scenario is resolved here too: the loop calls whichever handler was bound
+    # instead of re-comparing the scenario string on every arrival.
+    timeout = env.timeout
+    if scenario == "Rate-Limiting":
+        handler = lambda: server.rate_limited_request("Legitimate")
+    else:
+        handler = lambda: _serve(env, server, "Legitimate")
     while True:
-        yield env.timeout(random.expovariate(user_rate))
-        print(f"{env.now:.2f}s: Legitimate request")
-        
-        if scenario == "Rate-Limiting":
-            yield env.process(server.rate_limited_request("Legitimate"))
-        elif scenario == "Adaptive Scaling":
-            start_time = env.now
-            with server.server.request() as req:
-                yield req
-                yield env.process(server.process_request("Legitimate", start_time))
-                server.legitimate_processed_requests += 1
-            env.process(server.scale_resources())
+        yield timeout(next(user_gen))
+        if DEBUG:
+            print(f"{env.now:.2f}s: Legitimate request")
+
+        yield from handler()
 
 # Attacker Request Function
 # This function generates attack requests at specified rates and handles requests
 # based on the chosen mitigation scenario.
-def attacker(env, server, scenario, attack_rate):
+def attacker(env, server, scenario, attack_gen):
+    # Same local bindings and one-time scenario dispatch as in legitimate_user.
+    timeout = env.timeout
+    if scenario == "Rate-Limiting":
+        handler = lambda: server.rate_limited_request("Attack")
+    else:
+        handler = lambda: _serve(env, server, "Attack")
     while True:
-        yield env.timeout(random.expovariate(attack_rate))
-        print(f"{env.now:.2f}s: Attack request")
-
-        if scenario == "Rate-Limiting":
-            yield env.process(server.rate_limited_request("Attack"))
-        elif scenario == "Adaptive Scaling":
-            start_time = env.now
-            with server.server.request() as req:
-                yield req
-                yield env.process(server.process_request("Attack", start_time))
-            env.process(server.scale_resources())
+        yield timeout(next(attack_gen))
+        if DEBUG:
+            print(f"{env.now:.2f}s: Attack request")
+
+        yield from handler()
 
 # Running the Simulation
 # This function initialize the environment, sets up processes for legitimate users and
-# attackers, and runs the simulation. it returns key matrics for analysis. 
-def run_simulation(scenario, user_rate, attack_rate):
+# attackers, and runs the simulation. it returns key matrics for analysis.
+# An optional warm-up period runs first in the same environment: the metrics it
+# accumulates are simply zeroed before the measured window continues, so the
+# system starts the measurement in steady state without tearing down and
+# rebuilding the environment, server, and processes in between.
+def run_simulation(scenario, user_rate, attack_rate, seed=0, warmup=0):
     print(f"\n--- Running simulation with {scenario} mitigation strategy---")
     env = simpy.Environment()
-    server = Server(env, scaling=(scenario == "Adaptive Scaling"))
+
+    # One batched sample generator per rate, shared by all events of that stream,
+    # all fed from this run's own seeded RNG.
+    rng = np.random.default_rng(seed)
+    user_gen = rand_exp_gen(user_rate, rng=rng)
+    attack_gen = rand_exp_gen(attack_rate, rng=rng)
+    service_gen = rand_exp_gen(1.0, rng=rng)
+
+    server = Server(env, service_gen, scaling=(scenario == "Adaptive Scaling"))
 
     # Start processes
-    env.process(legitimate_user(env, server, scenario, user_rate))
-    env.process(attacker(env, server, scenario, attack_rate))
+    env.process(legitimate_user(env, server, scenario, user_gen))
+    env.process(attacker(env, server, scenario, attack_gen))
+    if server.scaling:
+        env.process(scaling_monitor(env, server))
 
     # Run simulation
-    env.run(until=SIM_TIME)
+    if warmup:
+        env.run(until=warmup)
+        # Discard everything observed while the system was filling up.
+        server._rt_sum = 0.0
+        server._rt_count = 0
+        server.legitimate_processed_requests = 0
+        server.legitimate_dropped_requests = 0
+    env.run(until=warmup + SIM_TIME)
 
     # Collect metrics
-    avg_response_time = sum(server.response_times) / len(server.response_times) if server.response_times else 0
+    avg_response_time = server._rt_sum / server._rt_count if server._rt_count else 0
     processed_requests = server.legitimate_processed_requests
     dropped_requests = server.legitimate_dropped_requests
 
     return avg_response_time, processed_requests, dropped_requests
 
+# Compiled Event Loop (optional Numba backend)
+# SimPy's generator machinery costs microseconds of interpreter overhead per event,
+# far more than this model's handful of float operations. The whole model fits in
+# one compiled next-event loop: two Poisson arrival clocks, a circular FIFO of
+# waiting requests, an array of in-service completion times, and running metric
+# sums. Numba is optional; without it the loop still runs as plain Python and the
+# SimPy backend remains available via '--backend simpy'.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Each stream (0 = legitimate, 1 = attack) is a closed loop, exactly like the
+# SimPy processes: it waits an exponential inter-arrival time, issues one request,
+# blocks until that request is served (or dropped), then starts over. A stream is
+# therefore always in one of three phases.
+_THINK = 0   # waiting for the next arrival; clock holds the arrival time
+_QUEUED = 1  # request waiting for the server; clock is inactive (INF)
+_SERVICE = 2 # request being served; clock holds the completion time
+
+def _simulate_core(user_rate, attack_rate, scaling, sim_time, seed):
+    # Exponential draws use the inverse transform -log(u)/rate directly: a uniform
+    # draw plus a log is cheaper than np.random.exponential's scalar path, both
+    # compiled and interpreted.
+    np.random.seed(seed)
+    INF = np.inf
+
+    rates = np.empty(2)
+    rates[0] = user_rate
+    rates[1] = attack_rate
+    phase = np.zeros(2, dtype=np.int64)
+    clock = np.empty(2) # next event time for each stream (INF while queued)
+    clock[0] = -np.log(np.random.random()) / user_rate
+    clock[1] = -np.log(np.random.random()) / attack_rate
+    start = np.zeros(2) # arrival time of each stream's outstanding request
+
+    # Server state: base capacity plus at most one temporary extra unit.
+    capacity = SERVER_INITIAL_CAPACITY
+    scaled_until = INF # time at which a temporary capacity boost expires
+    in_service = 0
+
+    # FIFO of queued streams; with two closed-loop streams it holds at most both.
+    queue = np.zeros(2, dtype=np.int64)
+    q_len = 0
+
+    rt_sum = 0.0
+    rt_count = 0
+    processed = 0
+    dropped = 0
+
+    while True:
+        t = min(min(clock[0], clock[1]), scaled_until)
+        if t >= sim_time:
+            break
+
+        if t == scaled_until:
+            # Temporary capacity expires; any extra in-service request just drains.
+            capacity = SERVER_INITIAL_CAPACITY
+            scaled_until = INF
+            continue
+
+        s = 0 if clock[0] <= clock[1] else 1
+
+        if phase[s] == _THINK:
+            # An arrival from stream s.
+            if (not scaling) and s == 0 and in_service >= RATE_LIMIT:
+                dropped += 1 # rate limiting only sheds legitimate load
+                clock[s] = t - np.log(np.random.random()) / rates[s]
+            elif in_service < capacity:
+                phase[s] = _SERVICE
+                start[s] = t
+                clock[s] = t - np.log(np.random.random())
+                in_service += 1
+            else:
+                phase[s] = _QUEUED
+                start[s] = t
+                clock[s] = INF
+                queue[q_len] = s
+                q_len += 1
+
+            # Adaptive scaling: one temporary extra unit while the backlog is deep,
+            # which immediately serves the request at the head of the queue.
+            if scaling and scaled_until == INF and q_len >= QUEUE_THRESHOLD:
+                capacity += 1
+                scaled_until = t + SCALING_DURATION
+                head = queue[0]
+                queue[0] = queue[1]
+                q_len -= 1
+                phase[head] = _SERVICE
+                clock[head] = t - np.log(np.random.random())
+                in_service += 1
+        else:
+            # Stream s's request finished service: record metrics, start the next
+            # inter-arrival wait, and hand the server to the next queued stream.
+            rt_sum += t - start[s]
+            rt_count += 1
+            if s == 0:
+                processed += 1
+            in_service -= 1
+            phase[s] = _THINK
+            clock[s] = t - np.log(np.random.random()) / rates[s]
+            if q_len > 0 and in_service < capacity:
+                head = queue[0]
+                queue[0] = queue[1]
+                q_len -= 1
+                phase[head] = _SERVICE
+                clock[head] = t - np.log(np.random.random())
+                in_service += 1
+
+    avg_rt = rt_sum / rt_count if rt_count else 0.0
+    return avg_rt, processed, dropped
+
+if njit is not None:
+    # cache=True keeps the compiled function on disk so the JIT cost is paid once,
+    # not on every sweep (and once per pool worker otherwise).
+    _simulate_core = njit(cache=True)(_simulate_core)
+
+def run_simulation_njit(scenario, user_rate, attack_rate, seed=0):
+    avg_rt, processed, dropped = _simulate_core(
+        user_rate, attack_rate, scenario == "Adaptive Scaling", float(SIM_TIME), seed)
+    return avg_rt, int(processed), int(dropped)
+
+# Replicated Runs
+# A single run per (scenario, rate) pair is a noisy one-sample estimate. Once the
+# event loop is compiled, each replication costs microseconds, so this draws
+# n_reps independent runs into numpy arrays and lets the caller aggregate them
+# vectorized (mean, confidence interval) instead of looping over run_simulation.
+def vec_simulate(user_rate, attack_rate, scaling, sim_time=SIM_TIME, n_reps=100, seed=0):
+    avg_rts = np.empty(n_reps)
+    processed = np.empty(n_reps, dtype=np.int64)
+    dropped = np.empty(n_reps, dtype=np.int64)
+    for i in range(n_reps):
+        avg_rts[i], processed[i], dropped[i] = _simulate_core(
+            user_rate, attack_rate, scaling, float(sim_time), seed + i)
+    return avg_rts, processed, dropped
+
+def run_simulation_reps(scenario, user_rate, attack_rate, n_reps, seed=0):
+    avg_rts, processed, dropped = vec_simulate(
+        user_rate, attack_rate, scenario == "Adaptive Scaling", SIM_TIME, n_reps, seed)
+    half = 1.96 * avg_rts.std() / np.sqrt(n_reps) # 95% confidence half-width
+    print(f"{scenario} (user {user_rate}, attack {attack_rate}): "
+          f"avg response time {avg_rts.mean():.2f} +/- {half:.2f} over {n_reps} reps")
+    return avg_rts.mean(), processed.mean(), dropped.mean()
+
 # The Results
 # Main Execution Loop
-# Run simulations for each rate combination under both scenarios and stores the results
-results = {"Rate-Limiting": {}, "Adaptive Scaling": {}}
-for user_rate, attack_rate in rate_combinations:
-    label = f"User Rate: {user_rate}, Attack Rate: {attack_rate}"
-    results["Rate-Limiting"][label] = run_simulation("Rate-Limiting", user_rate, attack_rate)
-    results["Adaptive Scaling"][label] = run_simulation("Adaptive Scaling", user_rate, attack_rate)
-
-# Plot the results
-for mitigation_strategy in results:
-    scenarios = list(results[mitigation_strategy].keys())
-    avg_response_times = [results[mitigation_strategy][scenario][0] for scenario in scenarios]
-    processed_requests = [results[mitigation_strategy][scenario][1] for scenario in scenarios]
-    dropped_requests = [results[mitigation_strategy][scenario][2] for scenario in scenarios]
+# Run simulations for each rate combination under both scenarios and stores the results.
+# Every (scenario, user_rate, attack_rate) job is fully independent, so they are
+# dispatched to a pool of worker processes instead of running one after the other.
+# The '__main__' guard keeps the workers from re-executing the sweep when they
+# import this module.
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="DDoS mitigation simulation sweep")
+    parser.add_argument("--backend", choices=("numba", "simpy"),
+                        default="numba" if njit is not None else "simpy",
+                        help="'numba' runs the compiled event loop; 'simpy' runs the "
+                             "reference implementation for validation")
+    parser.add_argument("--no-plot", action="store_true",
+                        help="skip matplotlib and write the results to results.json "
+                             "instead (required when running under PyPy)")
+    parser.add_argument("--reps", type=int, default=1,
+                        help="replications per sweep point; values above 1 use the "
+                             "compiled core and report the mean over all reps")
+    args = parser.parse_args()
+    runner = run_simulation if args.backend == "simpy" else run_simulation_njit
+
+    jobs = [(scenario, user_rate, attack_rate)
+            for user_rate, attack_rate in rate_combinations
+            for scenario in ("Rate-Limiting", "Adaptive Scaling")]
+    if args.reps > 1:
+        runner = run_simulation_reps
+        jobs = [job + (args.reps,) for job in jobs]
+    # A deterministic per-job seed keeps the sweep reproducible run to run and
+    # across pool workers, whichever runner is in use.
+    jobs = [job + (i,) for i, job in enumerate(jobs)]
+
+    with Pool(processes=min(len(jobs), os.cpu_count())) as pool:
+        outcomes = pool.starmap(runner, jobs)
+
+    results = {"Rate-Limiting": {}, "Adaptive Scaling": {}}
+    for (scenario, user_rate, attack_rate, *_), outcome in zip(jobs, outcomes):
+        label = f"User Rate: {user_rate}, Attack Rate: {attack_rate}"
+        results[scenario][label] = outcome
+
+    # Without plotting, dump the raw metrics instead; a plain-CPython plotter (or
+    # anything else) can pick results.json up from there.
+    if args.no_plot:
+        with open("results.json", "w") as f:
+            json.dump(results, f, indent=2, default=float)
+        print("Saved results.json")
+        raise SystemExit(0)
+
+    # Plot the results
+    # Each strategy's metrics go into one (scenarios x 3) array; a single figure
+    # is created up front and its axes cleared between strategies rather than
+    # allocating a fresh 3-row figure per strategy.
+    import matplotlib
+    matplotlib.use('Agg') # headless backend: no GUI event loop, works in CI/batch runs.
+    import matplotlib.pyplot as plt # used for visualizing the results through bar charts.
 
     fig, ax = plt.subplots(3, 1, figsize=(12, 18)) # To create three vertically stacked subplots, one for
     # each metric, and define the dememinsions of the entire figure with 'figsize' attribute.
-    
-    fig.suptitle(f"{mitigation_strategy} Results") # To add a main title to the figure
-
-    # Average Response Time subplots
-    ax[0].bar(scenarios, avg_response_times, color=['#4C72B0', '#55A868', '#C44E52', '#8172B2'])
-    ax[0].set_title("Average Response Time for Each Scenario")
-    ax[0].set_ylabel("Time (s)") # To add label for the y-axis
-    ax[0].tick_params(axis='x') # Formatting the x-axis 
-    for i, v in enumerate(avg_response_times):
-        ax[0].text(i, v + 0.1, f"{v:.2f}", ha='center') # Each bar includes the correspondind value 
-
-    # Processed Legitimate Requests subplots
-    ax[1].bar(scenarios, processed_requests, color=['#4C72B0', '#55A868', '#C44E52', '#8172B2'])
-    ax[1].set_title("Processed Legitimate Requests for Each Scenario")
-    ax[1].set_ylabel("Processed Requests")
-    ax[1].tick_params(axis='x')
-    for i, v in enumerate(processed_requests):
-        ax[1].text(i, v + 0.1, str(v), ha='center')
-
-    # Dropped Legitimate Requests subplots
-    ax[2].bar(scenarios, dropped_requests, color=['#4C72B0', '#55A868', '#C44E52', '#8172B2'])
-    ax[2].set_title("Dropped Legitimate Requests for Each Scenario")
-    ax[2].set_ylabel("Dropped Requests")
-    ax[2].tick_params(axis='x')
-    for i, v in enumerate(dropped_requests):
-        ax[2].text(i, v + 0.1, str(v), ha='center')
-
-    plt.tight_layout(rect=[0, 0.03, 1, 0.95]) # To adjust subplot spacing to ensure emements do not overlap
-    # 'rect' parameter shifts the layout to accommodate the main title
-    plt.show()
+
+    for mitigation_strategy in results:
+        for a in ax:
+            a.cla()
+
+        scenarios = list(results[mitigation_strategy].keys())
+        data = np.array([results[mitigation_strategy][scenario] for scenario in scenarios]) # shape (N, 3)
+
+        plot_strategy(ax, scenarios, data)
+        fig.suptitle(f"{mitigation_strategy} Results") # To add a main title to the figure
+
+        plt.tight_layout(rect=[0, 0.03, 1, 0.95]) # To adjust subplot spacing to ensure emements do not overlap
+        # 'rect' parameter shifts the layout to accommodate the main title
+
+        # Save instead of plt.show(): no blocking GUI event loop, and the chart
+        # survives the run as a file.
+        out_name = f"results_{mitigation_strategy.replace(' ', '_')}.png"
+        fig.savefig(out_name, dpi=100, bbox_inches='tight')
+        print(f"Saved {out_name}")
+
+    plt.close(fig) # frees the figure's memory once both strategies are rendered